@@ -1,6 +1,6 @@
 """Allocation calculator for Portfolio Tracker."""
 from collections import defaultdict
-from typing import NamedTuple, Callable
+from typing import NamedTuple, Callable, Hashable
 
 from .models import Portfolio, Holding, AssetType, Region, StatsBasic, StatsDetailed
 
@@ -16,6 +16,33 @@ class AllocationResult(NamedTuple):
     diff_with_target: float
 
 
+def _aggregate_by(
+    portfolio: Portfolio,
+    convert_to_eur: Callable[[float, str], float],
+    key: Callable[[Holding], Hashable],
+) -> tuple[dict, dict, float, float]:
+    """Sum EUR market values and target allocations per group in one pass.
+    
+    Each holding is converted to EUR exactly once.
+    
+    Returns:
+        Tuple of (value_eur_by_group, target_by_group, total_invested_eur,
+        total_with_cash_eur). Groups without holdings are absent from the dicts.
+    """
+    value_by_group: dict[Hashable, float] = defaultdict(float)
+    target_by_group: dict[Hashable, float] = defaultdict(float)
+    total_invested_eur = 0.0
+    
+    for holding in portfolio.holdings:
+        value_eur = convert_to_eur(holding.market_value, holding.currency)
+        group = key(holding)
+        value_by_group[group] += value_eur
+        target_by_group[group] += holding.target_allocation
+        total_invested_eur += value_eur
+    
+    return value_by_group, target_by_group, total_invested_eur, total_invested_eur + portfolio.free_cash
+
+
 def calculate_allocations(
     portfolio: Portfolio, 
     convert_to_eur: Callable[[float, str], float]
@@ -23,16 +50,12 @@ def calculate_allocations(
     """Calculate allocation percentages for all holdings using EUR values."""
     results = []
     
-    # Calculate total in EUR
-    total_invested_eur = sum(
-        convert_to_eur(h.market_value, h.currency) 
-        for h in portfolio.holdings
-    )
+    # Convert each holding to EUR once, then total
+    values_eur = [convert_to_eur(h.market_value, h.currency) for h in portfolio.holdings]
+    total_invested_eur = sum(values_eur)
     total_with_cash_eur = total_invested_eur + portfolio.free_cash
     
-    for holding in portfolio.holdings:
-        market_value_eur = convert_to_eur(holding.market_value, holding.currency)
-        
+    for holding, market_value_eur in zip(portfolio.holdings, values_eur):
         alloc_pct = market_value_eur / total_invested_eur if total_invested_eur > 0 else 0
         alloc_with_cash = market_value_eur / total_with_cash_eur if total_with_cash_eur > 0 else 0
         
@@ -54,24 +77,14 @@ def calculate_stats_by_type(
     convert_to_eur: Callable[[float, str], float]
 ) -> list[StatsBasic]:
     """Calculate allocation statistics grouped by asset type using EUR values."""
-    # Calculate totals in EUR
-    total_invested_eur = sum(
-        convert_to_eur(h.market_value, h.currency) 
-        for h in portfolio.holdings
+    value_by_type, target_by_type, total_invested_eur, total_with_cash_eur = _aggregate_by(
+        portfolio, convert_to_eur, lambda h: h.asset_type
     )
-    total_with_cash_eur = total_invested_eur + portfolio.free_cash
-    
-    # Group by type
-    by_type: dict[AssetType, list[Holding]] = defaultdict(list)
-    for holding in portfolio.holdings:
-        by_type[holding.asset_type].append(holding)
     
     stats = []
     for asset_type in AssetType:
-        holdings = by_type.get(asset_type, [])
-        
-        type_value_eur = sum(convert_to_eur(h.market_value, h.currency) for h in holdings)
-        type_target = sum(h.target_allocation for h in holdings)
+        type_value_eur = value_by_type.get(asset_type, 0.0)
+        type_target = target_by_type.get(asset_type, 0.0)
         
         current = type_value_eur / total_invested_eur if total_invested_eur > 0 else 0
         current_all = type_value_eur / total_with_cash_eur if total_with_cash_eur > 0 else 0
@@ -91,24 +104,14 @@ def calculate_stats_by_region(
     convert_to_eur: Callable[[float, str], float]
 ) -> list[StatsBasic]:
     """Calculate allocation statistics grouped by region using EUR values."""
-    # Calculate totals in EUR
-    total_invested_eur = sum(
-        convert_to_eur(h.market_value, h.currency) 
-        for h in portfolio.holdings
+    value_by_region, target_by_region, total_invested_eur, total_with_cash_eur = _aggregate_by(
+        portfolio, convert_to_eur, lambda h: h.region
     )
-    total_with_cash_eur = total_invested_eur + portfolio.free_cash
-    
-    # Group by region
-    by_region: dict[Region, list[Holding]] = defaultdict(list)
-    for holding in portfolio.holdings:
-        by_region[holding.region].append(holding)
     
     stats = []
     for region in Region:
-        holdings = by_region.get(region, [])
-        
-        region_value_eur = sum(convert_to_eur(h.market_value, h.currency) for h in holdings)
-        region_target = sum(h.target_allocation for h in holdings)
+        region_value_eur = value_by_region.get(region, 0.0)
+        region_target = target_by_region.get(region, 0.0)
         
         current = region_value_eur / total_invested_eur if total_invested_eur > 0 else 0
         current_all = region_value_eur / total_with_cash_eur if total_with_cash_eur > 0 else 0
@@ -128,18 +131,9 @@ def calculate_stats_detailed(
     convert_to_eur: Callable[[float, str], float]
 ) -> list[StatsDetailed]:
     """Calculate allocation statistics grouped by Type + Region combination using EUR values."""
-    # Calculate totals in EUR
-    total_invested_eur = sum(
-        convert_to_eur(h.market_value, h.currency) 
-        for h in portfolio.holdings
+    value_by_combo, target_by_combo, total_invested_eur, total_with_cash_eur = _aggregate_by(
+        portfolio, convert_to_eur, lambda h: (h.asset_type, h.region)
     )
-    total_with_cash_eur = total_invested_eur + portfolio.free_cash
-    
-    # Group by (type, region)
-    by_combo: dict[tuple[AssetType, Region], list[Holding]] = defaultdict(list)
-    for holding in portfolio.holdings:
-        key = (holding.asset_type, holding.region)
-        by_combo[key].append(holding)
     
     stats = []
     
@@ -150,13 +144,11 @@ def calculate_stats_detailed(
                 continue
             
             key = (asset_type, region)
-            holdings = by_combo.get(key, [])
-            
-            if not holdings:
+            if key not in value_by_combo:
                 continue  # Skip empty combinations
             
-            combo_value_eur = sum(convert_to_eur(h.market_value, h.currency) for h in holdings)
-            combo_target = sum(h.target_allocation for h in holdings)
+            combo_value_eur = value_by_combo[key]
+            combo_target = target_by_combo[key]
             
             current = combo_value_eur / total_invested_eur if total_invested_eur > 0 else 0
             current_all = combo_value_eur / total_with_cash_eur if total_with_cash_eur > 0 else 0
@@ -173,23 +165,36 @@ def calculate_stats_detailed(
 
 
 class PortfolioCalculator:
-    """Main calculator class that holds portfolio state and computes stats."""
+    """Main calculator class that holds portfolio state and computes stats.
+    
+    `revision` increases whenever the portfolio, its settings or free cash
+    change, so views can skip recomputing when nothing has changed. Code
+    that edits holdings in place must call mark_changed().
+    """
     
     def __init__(self, portfolio: Portfolio = None, settings_store=None):
         self.portfolio = portfolio or Portfolio()
         self.settings_store = settings_store
+        self.revision = 0
+    
+    def mark_changed(self) -> None:
+        """Record that the portfolio data has changed."""
+        self.revision += 1
     
     def set_portfolio(self, portfolio: Portfolio) -> None:
         """Set the portfolio to calculate stats for."""
         self.portfolio = portfolio
+        self.mark_changed()
     
     def set_settings_store(self, settings_store) -> None:
         """Set the settings store for currency conversion."""
         self.settings_store = settings_store
+        self.mark_changed()
     
     def set_free_cash(self, amount: float) -> None:
         """Set free cash amount."""
         self.portfolio.free_cash = amount
+        self.mark_changed()
     
     def convert_to_eur(self, amount: float, currency: str) -> float:
         """Convert amount to EUR using settings store rates."""
@@ -1,4 +1,5 @@
 """Data models for Portfolio Tracker."""
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
@@ -43,6 +44,10 @@ class Holding:
     target_allocation: float = 0.0  # Target allocation percentage (0-1)
     currency: str = "EUR"  # Currency of the instrument (EUR, USD, GBP, CNY, etc.)
     
+    def __post_init__(self):
+        # Few distinct currency codes, looked up often: share one string per code
+        self.currency = sys.intern(self.currency)
+    
     @property
     def allocation_pct(self) -> float:
         """Placeholder - actual allocation calculated by Portfolio."""
@@ -1,5 +1,6 @@
 """Persistence layer for Portfolio Tracker."""
 import json
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -80,7 +81,7 @@ class MappingsStore:
                     holding.asset_type = AssetType(mapping.get('asset_type', 'Unassigned'))
                     holding.region = Region(mapping.get('region', 'Unassigned'))
                     holding.target_allocation = float(mapping.get('target_allocation', 0))
-                    holding.currency = mapping.get('currency', 'EUR')
+                    holding.currency = sys.intern(mapping.get('currency', 'EUR'))
                 except (ValueError, KeyError):
                     pass
     
@@ -235,15 +236,23 @@ class SettingsStore:
     
     # Column order methods
     def get_column_order(self, table_name: str) -> Optional[list[int]]:
-        """Get saved column order for a table. Returns None if not saved."""
+        """Get saved column order for a table. Returns None if not saved.
+        
+        Legacy, read-only: column layouts are now saved as header states.
+        """
         column_orders = self.settings.get('column_orders', {})
         return column_orders.get(table_name)
     
-    def set_column_order(self, table_name: str, order: list[int]):
-        """Save column order for a table."""
-        if 'column_orders' not in self.settings:
-            self.settings['column_orders'] = {}
-        self.settings['column_orders'][table_name] = order
+    def get_column_state(self, table_name: str) -> Optional[str]:
+        """Get saved header state (hex-encoded) for a table. Returns None if not saved."""
+        column_states = self.settings.get('column_states', {})
+        return column_states.get(table_name)
+    
+    def set_column_state(self, table_name: str, state: str):
+        """Save header state (hex-encoded) for a table."""
+        if 'column_states' not in self.settings:
+            self.settings['column_states'] = {}
+        self.settings['column_states'][table_name] = state
         self.save()
     
     # Tab order methods
@@ -8,6 +8,7 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon
 
 from ui.main_window import MainWindow
+from ui.utils import invalidate_theme_cache
 
 
 def _resource_path(relative_path: str) -> Path:
@@ -33,6 +34,9 @@ def main():
     # Set application style
     app.setStyle("Fusion")
     
+    # Theme colors are cached; re-detect them when the palette changes
+    app.paletteChanged.connect(lambda _: invalidate_theme_cache())
+    
     # Set application icon (window title bar, taskbar)
     icon_path = _resource_path("assets/icon.ico")
     if icon_path.exists():
@@ -8,7 +8,7 @@ from PyQt6.QtGui import QDoubleValidator
 
 from core.persistence import SettingsStore
 from core.rates_fetcher import fetch_rates
-from .utils import setup_movable_columns, ALIGN_RIGHT_CENTER
+from .utils import setup_movable_columns, ALIGN_RIGHT_CENTER, NON_EDITABLE_FLAGS
 
 
 class RatesFetchThread(QThread):
@@ -171,7 +171,7 @@ class CurrencyTab(QWidget):
             
             # Currency name (read-only)
             item = QTableWidgetItem(currency)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            item.setFlags(NON_EDITABLE_FLAGS)
             if currency == "EUR":
                 item.setBackground(Qt.GlobalColor.lightGray)
             self.rates_table.setItem(row, 1, item)
@@ -182,7 +182,7 @@ class CurrencyTab(QWidget):
             item.setTextAlignment(ALIGN_RIGHT_CENTER)
             
             if currency == "EUR":
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                item.setFlags(NON_EDITABLE_FLAGS)
                 item.setBackground(Qt.GlobalColor.lightGray)
             
             self.rates_table.setItem(row, 2, item)
@@ -1,13 +1,16 @@
 """Instrument configuration tab for Portfolio Tracker."""
+import sys
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
     QHeaderView, QComboBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import pyqtSignal
 
 from core.models import AssetType, Region
 from core.calculator import PortfolioCalculator
 from core.persistence import SettingsStore
+from .utils import NON_EDITABLE_FLAGS
 
 
 class InstrumentConfigTab(QWidget):
@@ -59,70 +62,75 @@ class InstrumentConfigTab(QWidget):
         """Refresh the table with current portfolio data."""
         self.table.blockSignals(True)
         
-        portfolio = self.calculator.portfolio
-        currencies = self.settings_store.get_currencies()
-        
-        self.table.setRowCount(len(portfolio.holdings))
+        # Suspend sorting and repaints while filling: with sorting on, every
+        # setItem re-sorts the table
+        sorting_enabled = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
         
-        for row, holding in enumerate(portfolio.holdings):
-            # Instrument (read-only)
-            item = QTableWidgetItem(holding.instrument)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, self.COL_INSTRUMENT, item)
+        try:
+            portfolio = self.calculator.portfolio
+            currencies = self.settings_store.get_currencies()
             
-            # Currency (editable combo)
-            currency_combo = QComboBox()
-            for curr in currencies:
-                currency_combo.addItem(curr)
-            # Add current currency if not in list
-            if holding.currency not in currencies:
-                currency_combo.addItem(holding.currency)
-            currency_combo.setCurrentText(holding.currency)
-            currency_combo.currentTextChanged.connect(
-                lambda text, r=row: self.on_currency_changed(r, text)
-            )
-            self.table.setCellWidget(row, self.COL_CURRENCY, currency_combo)
+            self.table.setRowCount(len(portfolio.holdings))
             
-            # Type (editable combo)
-            type_combo = QComboBox()
-            for t in AssetType:
-                type_combo.addItem(t.value, t)
-            type_combo.setCurrentText(holding.asset_type.value)
-            type_combo.currentIndexChanged.connect(
-                lambda idx, r=row: self.on_type_changed(r, idx)
-            )
-            self.table.setCellWidget(row, self.COL_TYPE, type_combo)
-            
-            # Region (editable combo)
-            region_combo = QComboBox()
-            for r in Region:
-                region_combo.addItem(r.value, r)
-            region_combo.setCurrentText(holding.region.value)
-            region_combo.currentIndexChanged.connect(
-                lambda idx, r=row: self.on_region_changed(r, idx)
-            )
-            self.table.setCellWidget(row, self.COL_REGION, region_combo)
-        
-        self.table.blockSignals(False)
+            for row, holding in enumerate(portfolio.holdings):
+                # Instrument (read-only)
+                item = QTableWidgetItem(holding.instrument)
+                item.setFlags(NON_EDITABLE_FLAGS)
+                self.table.setItem(row, self.COL_INSTRUMENT, item)
+                
+                # Currency (editable combo)
+                currency_combo = QComboBox()
+                for curr in currencies:
+                    currency_combo.addItem(curr)
+                # Add current currency if not in list
+                if holding.currency not in currencies:
+                    currency_combo.addItem(holding.currency)
+                currency_combo.setCurrentText(holding.currency)
+                currency_combo.currentTextChanged.connect(
+                    lambda text, r=row: self.on_currency_changed(r, text)
+                )
+                self.table.setCellWidget(row, self.COL_CURRENCY, currency_combo)
+                
+                # Type (editable combo)
+                type_combo = QComboBox()
+                for t in AssetType:
+                    type_combo.addItem(t.value, t)
+                type_combo.setCurrentText(holding.asset_type.value)
+                type_combo.currentIndexChanged.connect(
+                    lambda idx, r=row, combo=type_combo: self.on_type_changed(r, combo.itemData(idx))
+                )
+                self.table.setCellWidget(row, self.COL_TYPE, type_combo)
+                
+                # Region (editable combo)
+                region_combo = QComboBox()
+                for r in Region:
+                    region_combo.addItem(r.value, r)
+                region_combo.setCurrentText(holding.region.value)
+                region_combo.currentIndexChanged.connect(
+                    lambda idx, r=row, combo=region_combo: self.on_region_changed(r, combo.itemData(idx))
+                )
+                self.table.setCellWidget(row, self.COL_REGION, region_combo)
+        finally:
+            self.table.setSortingEnabled(sorting_enabled)
+            self.table.setUpdatesEnabled(True)
+            self.table.blockSignals(False)
     
-    def on_currency_changed(self, row: int, currency: str):
-        """Handle currency change for a holding."""
-        if row < len(self.calculator.portfolio.holdings):
-            self.calculator.portfolio.holdings[row].currency = currency
+    def on_currency_changed(self, holding_idx: int, currency: str):
+        """Handle currency change for the holding at holding_idx (not the visible row)."""
+        if holding_idx < len(self.calculator.portfolio.holdings):
+            self.calculator.portfolio.holdings[holding_idx].currency = sys.intern(currency)
             self.config_changed.emit()
     
-    def on_type_changed(self, row: int, index: int):
-        """Handle asset type change for a holding."""
-        if row < len(self.calculator.portfolio.holdings):
-            combo = self.table.cellWidget(row, self.COL_TYPE)
-            new_type = combo.currentData()
-            self.calculator.portfolio.holdings[row].asset_type = new_type
+    def on_type_changed(self, holding_idx: int, new_type: AssetType):
+        """Handle asset type change for the holding at holding_idx (not the visible row)."""
+        if holding_idx < len(self.calculator.portfolio.holdings):
+            self.calculator.portfolio.holdings[holding_idx].asset_type = new_type
             self.config_changed.emit()
     
-    def on_region_changed(self, row: int, index: int):
-        """Handle region change for a holding."""
-        if row < len(self.calculator.portfolio.holdings):
-            combo = self.table.cellWidget(row, self.COL_REGION)
-            new_region = combo.currentData()
-            self.calculator.portfolio.holdings[row].region = new_region
+    def on_region_changed(self, holding_idx: int, new_region: Region):
+        """Handle region change for the holding at holding_idx (not the visible row)."""
+        if holding_idx < len(self.calculator.portfolio.holdings):
+            self.calculator.portfolio.holdings[holding_idx].region = new_region
             self.config_changed.emit()
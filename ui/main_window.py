@@ -340,10 +340,14 @@ class MainWindow(QMainWindow):
         # Save portfolio and mappings (no feedback needed when closing)
         self.save_all(show_feedback=False)
         
+        # Don't leave a stats computation running while the window is destroyed
+        self.stats_tab.shutdown()
+        
         event.accept()
     
     def refresh_all(self):
         """Refresh all views."""
+        self.calculator.mark_changed()
         self.portfolio_tab.refresh()
         self.config_tab.refresh()
         self.stats_tab.refresh()
@@ -390,6 +394,7 @@ class MainWindow(QMainWindow):
     
     def on_portfolio_changed(self):
         """Handle portfolio data change."""
+        self.calculator.mark_changed()
         self.config_tab.refresh()
         self.stats_tab.refresh()
         self.update_status_bar()
@@ -397,6 +402,7 @@ class MainWindow(QMainWindow):
     
     def on_config_changed(self):
         """Handle instrument configuration change."""
+        self.calculator.mark_changed()
         self.portfolio_tab.refresh()
         self.stats_tab.refresh()
         self.update_status_bar()
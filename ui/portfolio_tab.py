@@ -1,4 +1,6 @@
 """Portfolio table view for Portfolio Tracker."""
+from typing import Optional
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
     QHeaderView, QLabel, QLineEdit, QFrame, QPushButton, QMenu, QMessageBox,
@@ -12,8 +14,8 @@ from core.models import AssetType, Region
 from core.persistence import SettingsStore
 from .utils import (
     NumericTableItem, get_currency_symbol, parse_numeric_text,
-    get_alternating_row_color, get_highlight_row_color,
-    setup_movable_columns, ALIGN_RIGHT_CENTER
+    get_row_colors, get_highlight_colors,
+    setup_movable_columns, ALIGN_RIGHT_CENTER, NON_EDITABLE_FLAGS
 )
 
 
@@ -43,6 +45,9 @@ class PortfolioTab(QWidget):
     # Columns that should be highlighted (target-related)
     HIGHLIGHT_COLUMNS = {COL_DIFF_TARGET_PCT, COL_DIFF_IN_CASH, COL_DIFF_IN_SHARES}
     
+    # Item data role holding the index into portfolio.holdings (on the instrument cell)
+    HOLDING_IDX_ROLE = Qt.ItemDataRole.UserRole
+    
     def __init__(self, calculator: PortfolioCalculator, settings_store: SettingsStore, parent=None):
         super().__init__(parent)
         self.calculator = calculator
@@ -51,6 +56,9 @@ class PortfolioTab(QWidget):
         self._filter_text = ""  # Current search filter
         self._filter_type = None  # Current type filter (None = all)
         self._filter_region = None  # Current region filter (None = all)
+        # Even/odd row background brushes, rebuilt on each refresh
+        self._plain_brushes = tuple(QBrush(color) for color in get_row_colors())
+        self._highlight_brushes = tuple(QBrush(color) for color in get_highlight_colors())
         self.setup_ui()
     
     def setup_ui(self):
@@ -339,13 +347,52 @@ class PortfolioTab(QWidget):
         
         return True
     
-    def get_row_background(self, row: int, col: int):
-        """Get background color for a cell based on row and column."""
-        # Target-related columns get highlight color
-        if col in self.HIGHLIGHT_COLUMNS:
-            return get_highlight_row_color(row)
-        # Regular alternating colors
-        return get_alternating_row_color(row)
+    def holding_idx_at_row(self, row: int) -> Optional[int]:
+        """Get the index into portfolio.holdings of the holding shown at a visible row."""
+        item = self.table.item(row, self.COL_INSTRUMENT)
+        if item is None:
+            return None
+        return item.data(self.HOLDING_IDX_ROLE)
+    
+    def get_row_background(self, row: int, col: int) -> QBrush:
+        """Get background brush for a cell based on row and column.
+        
+        Uses the even/odd brush pairs built at the start of refresh().
+        """
+        # Target-related columns get highlight color, others regular alternating colors
+        brushes = self._highlight_brushes if col in self.HIGHLIGHT_COLUMNS else self._plain_brushes
+        return brushes[row & 1]
+    
+    def _reuse_item(self, row: int, col: int, text: str) -> tuple[QTableWidgetItem, bool]:
+        """Return the item already at (row, col) updated in place, or a new one.
+        
+        Returns:
+            Tuple of (item, created); only created items still need setItem,
+            since the table already owns reused ones
+        """
+        item = self.table.item(row, col)
+        if item is not None:
+            item.setText(text)
+            return item, False
+        return QTableWidgetItem(text), True
+    
+    def _reuse_numeric_item(self, row: int, col: int, text: str,
+                            value: float) -> tuple[NumericTableItem, bool]:
+        """Return the numeric item already at (row, col) updated in place, or a new one.
+        
+        Reusing items avoids allocating a new QTableWidgetItem per cell on
+        every refresh; the text color is reset since it depends on the value.
+        
+        Returns:
+            Tuple of (item, created); only created items still need setItem,
+            since the table already owns reused ones
+        """
+        item = self.table.item(row, col)
+        if isinstance(item, NumericTableItem):
+            item.set_value(text, value)
+            item.setData(Qt.ItemDataRole.ForegroundRole, None)
+            return item, False
+        return NumericTableItem(text, value), True
     
     def refresh(self):
         """Refresh the table with current portfolio data."""
@@ -361,167 +408,199 @@ class PortfolioTab(QWidget):
         
         self.table.blockSignals(True)  # Prevent triggering cellChanged
         
-        allocations = self.calculator.get_allocations()
-        
-        # Create allocation lookup
-        alloc_map = {a.instrument: a for a in allocations}
+        # Suspend sorting and repaints while filling: with sorting on, every
+        # setItem re-sorts the table
+        sorting_enabled = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
         
-        # Get total portfolio value in EUR for calculating diff in cash
-        total_eur = self.calculator.get_total_eur()
-        
-        # Filter holdings based on current filters
-        filtered_holdings = []
-        self._row_to_holding_idx = {}  # Map visible row to actual holding index
-        
-        for idx, holding in enumerate(portfolio.holdings):
-            if self._holding_matches_filter(holding):
-                self._row_to_holding_idx[len(filtered_holdings)] = idx
-                filtered_holdings.append((idx, holding))
-        
-        self.table.setRowCount(len(filtered_holdings))
-        
-        for row, (holding_idx, holding) in enumerate(filtered_holdings):
-            alloc = alloc_map.get(holding.instrument)
-            currency_symbol = get_currency_symbol(holding.currency)
-            
-            # Calculate diff values
-            diff_pct = alloc.diff_with_target if alloc else 0
-            
-            # Diff in cash: (target_allocation - current_allocation) * total_portfolio_EUR * exchange_rate
-            # This gives the amount in the instrument's currency
-            # Exchange rate = how many units of currency per 1 EUR
-            exchange_rate = self.settings_store.get_exchange_rate(holding.currency)
-            diff_in_cash_eur = diff_pct * total_eur
-            diff_in_cash = diff_in_cash_eur * exchange_rate  # Convert EUR to instrument currency
-            
-            # Diff in shares: diff_in_cash / last_price
-            if holding.last_price > 0:
-                diff_in_shares = diff_in_cash / holding.last_price
-            else:
-                diff_in_shares = 0
-            
-            # Delete button
-            delete_btn = QPushButton("×")
-            delete_btn.setFixedSize(24, 24)
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #999;
-                    border: none;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    color: #dc3545;
-                    background-color: #fee;
-                    border-radius: 12px;
-                }
-            """)
-            delete_btn.setToolTip(f"Delete {holding.instrument}")
-            delete_btn.clicked.connect(lambda checked, idx=holding_idx: self.delete_holding_by_idx(idx))
-            self.table.setCellWidget(row, self.COL_DELETE, delete_btn)
-            
-            # Instrument (editable)
-            item = QTableWidgetItem(holding.instrument)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_INSTRUMENT)))
-            self.table.setItem(row, self.COL_INSTRUMENT, item)
-            
-            # Position (editable) - numeric sorting
-            item = NumericTableItem(f"{holding.position:.2f}", holding.position)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_POSITION)))
-            self.table.setItem(row, self.COL_POSITION, item)
-            
-            # Last Price (editable) - numeric sorting
-            item = NumericTableItem(f"{holding.last_price:.2f}", holding.last_price)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_LAST_PRICE)))
-            self.table.setItem(row, self.COL_LAST_PRICE, item)
-            
-            # Market Value (read-only) - numeric sorting
-            item = NumericTableItem(f"{currency_symbol}{holding.market_value:,.2f}", holding.market_value)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_MARKET_VALUE)))
-            self.table.setItem(row, self.COL_MARKET_VALUE, item)
+        try:
+            allocations = self.calculator.get_allocations()
             
-            # Market Value (EUR) - numeric sorting
-            market_value_eur = self.settings_store.convert_to_eur(holding.market_value, holding.currency)
-            item = NumericTableItem(f"€{market_value_eur:,.2f}", market_value_eur)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_MARKET_VALUE_EUR)))
-            self.table.setItem(row, self.COL_MARKET_VALUE_EUR, item)
+            # Create allocation lookup
+            alloc_map = {a.instrument: a for a in allocations}
             
-            # Cost Basis (editable) - numeric sorting
-            item = NumericTableItem(f"{currency_symbol}{holding.cost_basis:,.2f}", holding.cost_basis)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_COST_BASIS)))
-            self.table.setItem(row, self.COL_COST_BASIS, item)
+            # Get total portfolio value in EUR for calculating diff in cash
+            total_eur = self.calculator.get_total_eur()
             
-            # Allocation % (read-only, calculated) - numeric sorting
-            alloc_pct = alloc.allocation_with_cash if alloc else 0
-            item = NumericTableItem(f"{alloc_pct * 100:.2f}%", alloc_pct)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_ALLOCATION)))
-            self.table.setItem(row, self.COL_ALLOCATION, item)
+            # Filter holdings based on current filters
+            filtered_holdings = [
+                (idx, holding) for idx, holding in enumerate(portfolio.holdings)
+                if self._holding_matches_filter(holding)
+            ]
             
-            # Target % (editable) - numeric sorting
-            item = NumericTableItem(f"{holding.target_allocation * 100:.1f}", holding.target_allocation)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_TARGET)))
-            self.table.setItem(row, self.COL_TARGET, item)
+            self.table.setRowCount(len(filtered_holdings))
             
-            # Diff w/ Target, % (read-only, calculated) - HIGHLIGHTED, numeric sorting
-            diff_text = f"{diff_pct * 100:+.2f}%"
-            item = NumericTableItem(diff_text, diff_pct)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_DIFF_TARGET_PCT)))
-            # Color text based on positive/negative
-            if diff_pct > 0.001:
-                item.setForeground(Qt.GlobalColor.darkGreen)
-            elif diff_pct < -0.001:
-                item.setForeground(Qt.GlobalColor.darkRed)
-            self.table.setItem(row, self.COL_DIFF_TARGET_PCT, item)
+            # Background brushes for even/odd rows, built once per refresh
+            self._plain_brushes = tuple(QBrush(color) for color in get_row_colors())
+            self._highlight_brushes = tuple(QBrush(color) for color in get_highlight_colors())
             
-            # Diff in Cash (read-only, calculated) - HIGHLIGHTED, numeric sorting
-            item = NumericTableItem(f"{currency_symbol}{diff_in_cash:+,.2f}", diff_in_cash)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_DIFF_IN_CASH)))
-            if diff_in_cash > 0.01:
-                item.setForeground(Qt.GlobalColor.darkGreen)
-            elif diff_in_cash < -0.01:
-                item.setForeground(Qt.GlobalColor.darkRed)
-            self.table.setItem(row, self.COL_DIFF_IN_CASH, item)
+            # Bind hot-loop methods to locals once, instead of per cell
+            set_item = self.table.setItem
+            reuse_item = self._reuse_item
+            numeric_item = self._reuse_numeric_item
+            row_background = self.get_row_background
+            get_exchange_rate = self.settings_store.get_exchange_rate
+            convert_to_eur = self.settings_store.convert_to_eur
             
-            # Diff in Shares (read-only, calculated) - HIGHLIGHTED, numeric sorting
-            item = NumericTableItem(f"{diff_in_shares:+,.2f}", diff_in_shares)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_DIFF_IN_SHARES)))
-            if diff_in_shares > 0.01:
-                item.setForeground(Qt.GlobalColor.darkGreen)
-            elif diff_in_shares < -0.01:
-                item.setForeground(Qt.GlobalColor.darkRed)
-            self.table.setItem(row, self.COL_DIFF_IN_SHARES, item)
+            for row, (holding_idx, holding) in enumerate(filtered_holdings):
+                alloc = alloc_map.get(holding.instrument)
+                currency_symbol = get_currency_symbol(holding.currency)
+                
+                # Calculate diff values
+                diff_pct = alloc.diff_with_target if alloc else 0
+                
+                # Diff in cash: (target_allocation - current_allocation) * total_portfolio_EUR * exchange_rate
+                # This gives the amount in the instrument's currency
+                # Exchange rate = how many units of currency per 1 EUR
+                exchange_rate = get_exchange_rate(holding.currency)
+                diff_in_cash_eur = diff_pct * total_eur
+                diff_in_cash = diff_in_cash_eur * exchange_rate  # Convert EUR to instrument currency
+                
+                # Diff in shares: diff_in_cash / last_price
+                if holding.last_price > 0:
+                    diff_in_shares = diff_in_cash / holding.last_price
+                else:
+                    diff_in_shares = 0
+                
+                # Delete button
+                delete_btn = QPushButton("×")
+                delete_btn.setFixedSize(24, 24)
+                delete_btn.setStyleSheet("""
+                    QPushButton {
+                        background-color: transparent;
+                        color: #999;
+                        border: none;
+                        font-size: 16px;
+                        font-weight: bold;
+                    }
+                    QPushButton:hover {
+                        color: #dc3545;
+                        background-color: #fee;
+                        border-radius: 12px;
+                    }
+                """)
+                delete_btn.setToolTip(f"Delete {holding.instrument}")
+                delete_btn.clicked.connect(lambda checked, idx=holding_idx: self.delete_holding_by_idx(idx))
+                self.table.setCellWidget(row, self.COL_DELETE, delete_btn)
+                
+                # Instrument (editable)
+                item, created = reuse_item(row, self.COL_INSTRUMENT, holding.instrument)
+                # The row's holding travels with the item when the table is sorted
+                item.setData(self.HOLDING_IDX_ROLE, holding_idx)
+                item.setBackground(row_background(row, self.COL_INSTRUMENT))
+                if created:
+                    set_item(row, self.COL_INSTRUMENT, item)
+                
+                # Position (editable) - numeric sorting
+                item, created = numeric_item(row, self.COL_POSITION, f"{holding.position:.2f}", holding.position)
+                item.setTextAlignment(ALIGN_RIGHT_CENTER)
+                item.setBackground(row_background(row, self.COL_POSITION))
+                if created:
+                    set_item(row, self.COL_POSITION, item)
+                
+                # Last Price (editable) - numeric sorting
+                item, created = numeric_item(row, self.COL_LAST_PRICE, f"{holding.last_price:.2f}", holding.last_price)
+                item.setTextAlignment(ALIGN_RIGHT_CENTER)
+                item.setBackground(row_background(row, self.COL_LAST_PRICE))
+                if created:
+                    set_item(row, self.COL_LAST_PRICE, item)
+                
+                # Market Value (read-only) - numeric sorting
+                item, created = numeric_item(row, self.COL_MARKET_VALUE, f"{currency_symbol}{holding.market_value:,.2f}", holding.market_value)
+                item.setFlags(NON_EDITABLE_FLAGS)
+                item.setTextAlignment(ALIGN_RIGHT_CENTER)
+                item.setBackground(row_background(row, self.COL_MARKET_VALUE))
+                if created:
+                    set_item(row, self.COL_MARKET_VALUE, item)
+                
+                # Market Value (EUR) - numeric sorting
+                market_value_eur = convert_to_eur(holding.market_value, holding.currency)
+                item, created = numeric_item(row, self.COL_MARKET_VALUE_EUR, f"€{market_value_eur:,.2f}", market_value_eur)
+                item.setFlags(NON_EDITABLE_FLAGS)
+                item.setTextAlignment(ALIGN_RIGHT_CENTER)
+                item.setBackground(row_background(row, self.COL_MARKET_VALUE_EUR))
+                if created:
+                    set_item(row, self.COL_MARKET_VALUE_EUR, item)
+                
+                # Cost Basis (editable) - numeric sorting
+                item, created = numeric_item(row, self.COL_COST_BASIS, f"{currency_symbol}{holding.cost_basis:,.2f}", holding.cost_basis)
+                item.setTextAlignment(ALIGN_RIGHT_CENTER)
+                item.setBackground(row_background(row, self.COL_COST_BASIS))
+                if created:
+                    set_item(row, self.COL_COST_BASIS, item)
+                
+                # Allocation % (read-only, calculated) - numeric sorting
+                alloc_pct = alloc.allocation_with_cash if alloc else 0
+                item, created = numeric_item(row, self.COL_ALLOCATION, f"{alloc_pct * 100:.2f}%", alloc_pct)
+                item.setFlags(NON_EDITABLE_FLAGS)
+                item.setTextAlignment(ALIGN_RIGHT_CENTER)
+                item.setBackground(row_background(row, self.COL_ALLOCATION))
+                if created:
+                    set_item(row, self.COL_ALLOCATION, item)
+                
+                # Target % (editable) - numeric sorting
+                item, created = numeric_item(row, self.COL_TARGET, f"{holding.target_allocation * 100:.1f}", holding.target_allocation)
+                item.setTextAlignment(ALIGN_RIGHT_CENTER)
+                item.setBackground(row_background(row, self.COL_TARGET))
+                if created:
+                    set_item(row, self.COL_TARGET, item)
+                
+                # Diff w/ Target, % (read-only, calculated) - HIGHLIGHTED, numeric sorting
+                diff_text = f"{diff_pct * 100:+.2f}%"
+                item, created = numeric_item(row, self.COL_DIFF_TARGET_PCT, diff_text, diff_pct)
+                item.setFlags(NON_EDITABLE_FLAGS)
+                item.setTextAlignment(ALIGN_RIGHT_CENTER)
+                item.setBackground(row_background(row, self.COL_DIFF_TARGET_PCT))
+                # Color text based on positive/negative
+                if diff_pct > 0.001:
+                    item.setForeground(Qt.GlobalColor.darkGreen)
+                elif diff_pct < -0.001:
+                    item.setForeground(Qt.GlobalColor.darkRed)
+                if created:
+                    set_item(row, self.COL_DIFF_TARGET_PCT, item)
+                
+                # Diff in Cash (read-only, calculated) - HIGHLIGHTED, numeric sorting
+                item, created = numeric_item(row, self.COL_DIFF_IN_CASH, f"{currency_symbol}{diff_in_cash:+,.2f}", diff_in_cash)
+                item.setFlags(NON_EDITABLE_FLAGS)
+                item.setTextAlignment(ALIGN_RIGHT_CENTER)
+                item.setBackground(row_background(row, self.COL_DIFF_IN_CASH))
+                if diff_in_cash > 0.01:
+                    item.setForeground(Qt.GlobalColor.darkGreen)
+                elif diff_in_cash < -0.01:
+                    item.setForeground(Qt.GlobalColor.darkRed)
+                if created:
+                    set_item(row, self.COL_DIFF_IN_CASH, item)
+                
+                # Diff in Shares (read-only, calculated) - HIGHLIGHTED, numeric sorting
+                item, created = numeric_item(row, self.COL_DIFF_IN_SHARES, f"{diff_in_shares:+,.2f}", diff_in_shares)
+                item.setFlags(NON_EDITABLE_FLAGS)
+                item.setTextAlignment(ALIGN_RIGHT_CENTER)
+                item.setBackground(row_background(row, self.COL_DIFF_IN_SHARES))
+                if diff_in_shares > 0.01:
+                    item.setForeground(Qt.GlobalColor.darkGreen)
+                elif diff_in_shares < -0.01:
+                    item.setForeground(Qt.GlobalColor.darkRed)
+                if created:
+                    set_item(row, self.COL_DIFF_IN_SHARES, item)
+                
+                # Unrealized P&L (editable) - numeric sorting
+                item, created = numeric_item(row, self.COL_UNREALIZED_PNL, f"{holding.unrealized_pnl:.2f}", holding.unrealized_pnl)
+                item.setTextAlignment(ALIGN_RIGHT_CENTER)
+                item.setBackground(row_background(row, self.COL_UNREALIZED_PNL))
+                if holding.unrealized_pnl > 0:
+                    item.setForeground(Qt.GlobalColor.darkGreen)
+                elif holding.unrealized_pnl < 0:
+                    item.setForeground(Qt.GlobalColor.darkRed)
+                if created:
+                    set_item(row, self.COL_UNREALIZED_PNL, item)
             
-            # Unrealized P&L (editable) - numeric sorting
-            item = NumericTableItem(f"{holding.unrealized_pnl:.2f}", holding.unrealized_pnl)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setBackground(QBrush(self.get_row_background(row, self.COL_UNREALIZED_PNL)))
-            if holding.unrealized_pnl > 0:
-                item.setForeground(Qt.GlobalColor.darkGreen)
-            elif holding.unrealized_pnl < 0:
-                item.setForeground(Qt.GlobalColor.darkRed)
-            self.table.setItem(row, self.COL_UNREALIZED_PNL, item)
-        
-        # Update summary
-        self.update_summary()
-        
-        self.table.blockSignals(False)
+            # Update summary
+            self.update_summary()
+        finally:
+            self.table.setSortingEnabled(sorting_enabled)
+            self.table.setUpdatesEnabled(True)
+            self.table.blockSignals(False)
     
     def update_summary(self):
         """Update the summary labels."""
@@ -554,8 +633,8 @@ class PortfolioTab(QWidget):
     
     def on_cell_changed(self, row: int, col: int):
         """Handle cell value change."""
-        # Get actual holding index from row mapping
-        holding_idx = self._row_to_holding_idx.get(row)
+        # Get actual holding index stored on the row
+        holding_idx = self.holding_idx_at_row(row)
         if holding_idx is None or holding_idx >= len(self.calculator.portfolio.holdings):
             return
         
@@ -616,8 +695,8 @@ class PortfolioTab(QWidget):
     
     def delete_holding(self, row: int):
         """Delete a holding at the specified visible row."""
-        # Get actual holding index from row mapping
-        holding_idx = self._row_to_holding_idx.get(row)
+        # Get actual holding index stored on the row
+        holding_idx = self.holding_idx_at_row(row)
         if holding_idx is None:
             return
         self.delete_holding_by_idx(holding_idx)
@@ -645,7 +724,7 @@ class PortfolioTab(QWidget):
     def show_context_menu(self, position):
         """Show context menu for right-click actions."""
         row = self.table.rowAt(position.y())
-        holding_idx = self._row_to_holding_idx.get(row)
+        holding_idx = self.holding_idx_at_row(row)
         if holding_idx is None or holding_idx >= len(self.calculator.portfolio.holdings):
             return
         
@@ -1,9 +1,11 @@
 """Data review dialog for Portfolio Tracker."""
+from operator import attrgetter
+
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QDialog, QVBoxLayout, QHBoxLayout, QTableView,
     QHeaderView, QLabel, QPushButton, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QColor
 
 from core.models import Holding
@@ -13,6 +15,80 @@ from .utils import (
 )
 
 
+class HoldingsReviewModel(QAbstractTableModel):
+    """Editable table model holding the cell texts of imported holdings.
+    
+    Cells are formatted once and painted on demand by the view, so large
+    imports don't allocate an item object for every cell.
+    """
+    
+    def __init__(self, column_names: tuple[str, ...], numeric_columns: tuple[bool, ...], parent=None):
+        """Initialize the model.
+        
+        Args:
+            column_names: Header text of each column
+            numeric_columns: Whether each column holds a right-aligned number
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self._column_names = column_names
+        self._numeric_columns = numeric_columns
+        self._rows: list[list[str]] = []
+        self._backgrounds: dict[tuple[int, int], QColor] = {}
+    
+    def set_rows(self, rows: list[list[str]]):
+        """Replace all rows (clears any highlighted cells)."""
+        self.beginResetModel()
+        self._rows = rows
+        self._backgrounds = {}
+        self.endResetModel()
+    
+    def cell_text(self, row: int, col: int) -> str:
+        """Get the current (possibly edited) text of a cell."""
+        return self._rows[row][col]
+    
+    def set_background(self, row: int, col: int, color: QColor):
+        """Set the background color of a cell."""
+        self._backgrounds[(row, col)] = color
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.BackgroundRole])
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._column_names)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._rows[row][col]
+        if role == Qt.ItemDataRole.TextAlignmentRole and self._numeric_columns[col]:
+            return ALIGN_RIGHT_CENTER
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._backgrounds.get((row, col))
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = str(value)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        return True
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsEditable
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._column_names[section]
+        return super().headerData(section, orientation, role)
+
+
 class ReviewDialog(QDialog):
     """Dialog for reviewing and editing imported data before confirmation."""
     
@@ -30,11 +106,20 @@ class ReviewDialog(QDialog):
         ("Daily P&L", float, True),
         ("Unrealized P&L", float, True),
     ]
+    COLUMN_NAMES = tuple(col[0] for col in COLUMNS)
+    NUMERIC_COLUMNS = tuple(col[2] for col in COLUMNS)
+    
+    # Holding fields shown in the numeric columns, in column order
+    NUMERIC_FIELDS = (
+        'position', 'last_price', 'change_pct', 'cost_basis',
+        'market_value', 'avg_price', 'daily_pnl', 'unrealized_pnl',
+    )
     
     def __init__(self, holdings: list[Holding], source_file: str = "", parent=None):
         super().__init__(parent)
         self.holdings = holdings
         self.source_file = source_file
+        self._warn_yellow, self._warn_red = get_warning_colors()
         self.setWindowTitle("Review Imported Data")
         self.setMinimumSize(900, 500)
         self.setup_ui()
@@ -63,7 +148,9 @@ class ReviewDialog(QDialog):
         layout.addWidget(info_label)
         
         # Table
-        self.table = QTableWidget()
+        self.table = QTableView()
+        self.model = HoldingsReviewModel(self.COLUMN_NAMES, self.NUMERIC_COLUMNS, self)
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.setup_table()
         layout.addWidget(self.table)
@@ -108,9 +195,6 @@ class ReviewDialog(QDialog):
     
     def setup_table(self):
         """Set up the review table."""
-        self.table.setColumnCount(len(self.COLUMNS))
-        self.table.setHorizontalHeaderLabels([col[0] for col in self.COLUMNS])
-        
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         for i in range(1, len(self.COLUMNS)):
@@ -121,62 +205,41 @@ class ReviewDialog(QDialog):
     
     def populate_table(self):
         """Populate the table with holdings data."""
-        self.table.setRowCount(len(self.holdings))
+        # Read all numeric fields of a holding in one call
+        get_values = attrgetter(*self.NUMERIC_FIELDS)
+        change_idx = self.NUMERIC_FIELDS.index('change_pct')
+        format_numeric = self.format_numeric
         
+        rows = []
+        for holding in self.holdings:
+            values = list(get_values(holding))
+            values[change_idx] *= 100  # Display as percentage
+            rows.append([holding.instrument, *map(format_numeric, values)])
+        self.model.set_rows(rows)
+        
+        # Highlight potential issues
         for row, holding in enumerate(self.holdings):
-            # Instrument
-            item = QTableWidgetItem(holding.instrument)
-            self.table.setItem(row, 0, item)
-            
-            # Position
-            self.set_numeric_cell(row, 1, holding.position)
-            
-            # Last Price
-            self.set_numeric_cell(row, 2, holding.last_price)
-            
-            # Change %
-            self.set_numeric_cell(row, 3, holding.change_pct * 100)  # Display as percentage
-            
-            # Cost Basis
-            self.set_numeric_cell(row, 4, holding.cost_basis)
-            
-            # Market Value
-            self.set_numeric_cell(row, 5, holding.market_value)
-            
-            # Avg Price
-            self.set_numeric_cell(row, 6, holding.avg_price)
-            
-            # Daily P&L
-            self.set_numeric_cell(row, 7, holding.daily_pnl)
-            
-            # Unrealized P&L
-            self.set_numeric_cell(row, 8, holding.unrealized_pnl)
-            
-            # Highlight potential issues
             self.check_row_issues(row, holding)
         
         self.row_count_label.setText(f"Total: {len(self.holdings)} holdings")
     
-    def set_numeric_cell(self, row: int, col: int, value: float):
-        """Set a numeric cell value."""
-        item = QTableWidgetItem(f"{value:,.2f}")
-        item.setTextAlignment(ALIGN_RIGHT_CENTER)
-        self.table.setItem(row, col, item)
+    @staticmethod
+    def format_numeric(value: float) -> str:
+        """Format a numeric cell value."""
+        return f"{value:,.2f}"
     
     def check_row_issues(self, row: int, holding: Holding):
         """Check for potential issues in a row and highlight if needed."""
-        warning_yellow, warning_red = get_warning_colors()
+        warning_yellow, warning_red = self._warn_yellow, self._warn_red
         
         # Check for zero/missing market value
         if holding.market_value == 0:
             self.highlight_cell(row, 5, warning_yellow)
         
-        # Check for zero position
+        # Check for zero position, or suspicious negative position
         if holding.position == 0:
             self.highlight_cell(row, 1, warning_yellow)
-        
-        # Check for suspicious values (negative position, etc.)
-        if holding.position < 0:
+        elif holding.position < 0:
             self.highlight_cell(row, 1, warning_red)
         
         # Check for missing cost basis when market value exists
@@ -185,17 +248,15 @@ class ReviewDialog(QDialog):
     
     def highlight_cell(self, row: int, col: int, color: QColor):
         """Highlight a cell with the given color."""
-        item = self.table.item(row, col)
-        if item:
-            item.setBackground(color)
+        self.model.set_background(row, col, color)
     
     def get_edited_holdings(self) -> list[Holding]:
         """Get the holdings with any edits applied."""
         holdings = []
         
-        for row in range(self.table.rowCount()):
+        for row in range(self.model.rowCount()):
             try:
-                instrument = self.table.item(row, 0).text().strip()
+                instrument = self.model.cell_text(row, 0).strip()
                 if not instrument:
                     continue
                 
@@ -219,10 +280,7 @@ class ReviewDialog(QDialog):
     
     def parse_cell_float(self, row: int, col: int) -> float:
         """Parse a float from a table cell."""
-        item = self.table.item(row, col)
-        if item is None:
-            return 0.0
-        return parse_numeric_text(item.text())
+        return parse_numeric_text(self.model.cell_text(row, col))
     
     def on_confirm(self):
         """Handle confirm button click."""
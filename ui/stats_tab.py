@@ -1,22 +1,31 @@
 """Statistics view for Portfolio Tracker."""
+from operator import attrgetter
+from typing import Callable
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QHeaderView, QGroupBox, QSplitter, QFrame
 )
-from PyQt6.QtCore import Qt
-
-import matplotlib
-matplotlib.use('QtAgg')  # Use Qt backend
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QTimer, QThread, pyqtSignal
+)
+from PyQt6.QtGui import QFont
 
 from core.calculator import PortfolioCalculator
 from core.persistence import SettingsStore
-from .utils import NumericTableItem, setup_movable_columns, ALIGN_RIGHT_CENTER
+from .utils import setup_movable_columns, ALIGN_RIGHT_CENTER, NON_EDITABLE_FLAGS
+
+
+# Formats a fraction as a percentage string, e.g. 0.1234 -> "12.34%"
+format_pct = "{:.2%}".format
 
 
 class PieChartWidget(QWidget):
-    """Widget displaying a pie chart using matplotlib."""
+    """Widget displaying a pie chart using matplotlib.
+    
+    matplotlib is imported and the figure created the first time the widget
+    is shown, so it does not slow down application start-up.
+    """
     
     # Color palette for charts
     COLORS = [
@@ -27,12 +36,23 @@ class PieChartWidget(QWidget):
     def __init__(self, title: str = "", parent=None):
         super().__init__(parent)
         self.title = title
+        self.figure = None
+        self.canvas = None
+        self._data: list[tuple[str, float]] = []
+        self._needs_redraw = False
         self.setup_ui()
     
     def setup_ui(self):
-        """Set up the chart widget."""
+        """Set up the chart widget (the canvas is created on first show)."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
+    
+    def _create_canvas(self):
+        """Import matplotlib and create the figure and canvas."""
+        import matplotlib
+        matplotlib.use('QtAgg')  # Use Qt backend
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
         
         # Create matplotlib figure
         self.figure = Figure(figsize=(4, 3), dpi=100)
@@ -40,14 +60,37 @@ class PieChartWidget(QWidget):
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setStyleSheet("background-color: transparent;")
         
-        layout.addWidget(self.canvas)
+        self.layout().addWidget(self.canvas)
+    
+    def showEvent(self, event):
+        """Draw any pending chart data once the widget becomes visible."""
+        super().showEvent(event)
+        if self._needs_redraw:
+            self.draw_chart()
     
     def update_chart(self, data: list[tuple[str, float]]):
         """Update the pie chart with new data.
         
+        Drawing is deferred until the widget is visible, and skipped if the
+        data is the same as what is already drawn.
+        
         Args:
             data: List of (label, value) tuples
         """
+        if self.canvas is not None and data == self._data:
+            return
+        self._data = data
+        self._needs_redraw = True
+        if self.isVisible():
+            self.draw_chart()
+    
+    def draw_chart(self):
+        """Draw the pie chart from the stored data."""
+        if self.canvas is None:
+            self._create_canvas()
+        self._needs_redraw = False
+        data = self._data
+        
         self.figure.clear()
         
         # Filter out zero/negative values
@@ -61,7 +104,7 @@ class PieChartWidget(QWidget):
             ax.set_xlim(0, 1)
             ax.set_ylim(0, 1)
             ax.axis('off')
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         
         labels, values = zip(*filtered_data)
@@ -99,16 +142,172 @@ class PieChartWidget(QWidget):
         )
         
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+
+
+class StatsTableModel(QAbstractTableModel):
+    """Read-only table model for a stats table: one row per stat plus a TOTAL row.
+    
+    Display texts are formatted once per update; the view paints cells on
+    demand. Raw values are exposed under SORT_ROLE for numeric sorting.
+    """
+    
+    SORT_ROLE = Qt.ItemDataRole.UserRole
+    
+    # Bold font of the TOTAL row, shared by every stats model (created on first use)
+    _bold_font: QFont | None = None
+    
+    def __init__(self, column_names: tuple[str, ...], tooltips: tuple[str, ...],
+                 category_cols: list[Callable], parent=None):
+        """Initialize the model.
+        
+        Args:
+            column_names: Header text of each column
+            tooltips: Header tooltip of each column
+            category_cols: Functions extracting the text of each leading
+                category column from a stat; the Current %, Current All %
+                and Target % columns follow them
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self._column_names = column_names
+        self._tooltips = tooltips
+        self._category_cols = category_cols
+        self._first_num_col = len(category_cols)
+        self._texts: list[list[str]] = []
+        self._values: list[list] = []
+        self._fingerprint = None  # Hash of the stats currently shown
+        if StatsTableModel._bold_font is None:
+            StatsTableModel._bold_font = QFont()
+            StatsTableModel._bold_font.setBold(True)
+    
+    def set_stats(self, stats: list):
+        """Replace the rows with the given StatsBasic / StatsDetailed entries.
+        
+        When the row count is unchanged only the rows whose text differs are
+        signalled as changed; otherwise the model is reset.
+        """
+        num_values = [[s.current, s.current_all, s.target] for s in stats]
+        categories = [[get_text(s) for get_text in self._category_cols] for s in stats]
+        
+        # Skip all formatting when the content is the same as last time
+        fingerprint = hash(tuple(tuple(cats + nums) for cats, nums in zip(categories, num_values)))
+        if fingerprint == self._fingerprint:
+            return
+        self._fingerprint = fingerprint
+        
+        # Total row (empty cells under any further category columns)
+        totals = [sum(column) for column in zip(*num_values)] if num_values else [0.0, 0.0, 0.0]
+        num_values.append(totals)
+        categories.append(["TOTAL"] + [""] * (self._first_num_col - 1))
+        
+        # Format every percentage cell in one pass, before building the rows
+        num_texts = [list(map(format_pct, values)) for values in num_values]
+        
+        texts = [cats + cells for cats, cells in zip(categories, num_texts)]
+        values = [cats + nums for cats, nums in zip(categories, num_values)]
+        
+        if len(texts) != len(self._texts):
+            self.beginResetModel()
+            self._texts, self._values = texts, values
+            self.endResetModel()
+            return
+        
+        changed_rows = [row for row, (old, new) in enumerate(zip(self._texts, texts)) if old != new]
+        self._texts, self._values = texts, values
+        last_col = len(self._column_names) - 1
+        for row in changed_rows:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last_col))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._texts)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._column_names)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._texts[row][col]
+        if role == self.SORT_ROLE:
+            return self._values[row][col]
+        if role == Qt.ItemDataRole.TextAlignmentRole and col >= self._first_num_col:
+            return ALIGN_RIGHT_CENTER
+        if role == Qt.ItemDataRole.FontRole and row == len(self._texts) - 1:
+            return self._bold_font
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return NON_EDITABLE_FLAGS
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self._column_names[section]
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return self._tooltips[section]
+        return super().headerData(section, orientation, role)
+
+
+class StatsComputeThread(QThread):
+    """Worker thread that computes the type, region and detailed stats."""
+    # Emits (calculator revision, type stats, region stats, detailed stats)
+    stats_ready = pyqtSignal(int, list, list, list)
+
+    def __init__(self, calculator: PortfolioCalculator, parent=None):
+        super().__init__(parent)
+        self.calculator = calculator
+
+    def run(self):
+        revision = self.calculator.revision
+        self.stats_ready.emit(
+            revision,
+            self.calculator.get_stats_by_type(),
+            self.calculator.get_stats_by_region(),
+            self.calculator.get_stats_detailed(),
+        )
 
 
 class StatsTab(QWidget):
     """Statistics tab showing allocation breakdown by Type and Region."""
     
+    # Column headers and header tooltips of the basic (Type / Region) tables
+    STATS_COLUMNS = ("Category", "Current %", "Current All %", "Target %")
+    STATS_TOOLTIPS = (
+        "Asset type or region category",
+        "Allocation % of invested capital (excludes free cash)",
+        "Allocation % of total portfolio (includes free cash)",
+        "Sum of target allocations for this category",
+    )
+    
+    # Column headers and header tooltips of the detailed (Type + Region) table
+    DETAILED_COLUMNS = ("Type", "Region", "Current %", "Current All %", "Target %")
+    DETAILED_TOOLTIPS = (
+        "Asset type (Equity, Bonds, etc.)",
+        "Geographic region (US, EU, EM, Global)",
+        "Allocation % of invested capital (excludes free cash)",
+        "Allocation % of total portfolio (includes free cash)",
+        "Sum of target allocations for this combination",
+    )
+    
     def __init__(self, calculator: PortfolioCalculator, settings_store: SettingsStore, parent=None):
         super().__init__(parent)
         self.calculator = calculator
         self.settings_store = settings_store
+        self._last_revision = -1  # Calculator revision shown in the tables
+        self._compute_thread = None
+        self._shutting_down = False  # Set by shutdown(); no new computations after that
+        
+        # Coalesces several refresh() calls in one event-loop turn into one rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -147,14 +346,20 @@ class StatsTab(QWidget):
         # By Type table
         type_group = QGroupBox("STATS by Type")
         type_layout = QVBoxLayout(type_group)
-        self.type_table = self.create_stats_table('stats_type')
+        self.type_model = StatsTableModel(
+            self.STATS_COLUMNS, self.STATS_TOOLTIPS, [attrgetter('category')], self
+        )
+        self.type_table = self.create_stats_table('stats_type', self.type_model)
         type_layout.addWidget(self.type_table)
         basic_layout.addWidget(type_group)
         
         # By Region table
         region_group = QGroupBox("STATS by Region")
         region_layout = QVBoxLayout(region_group)
-        self.region_table = self.create_stats_table('stats_region')
+        self.region_model = StatsTableModel(
+            self.STATS_COLUMNS, self.STATS_TOOLTIPS, [attrgetter('category')], self
+        )
+        self.region_table = self.create_stats_table('stats_region', self.region_model)
         region_layout.addWidget(self.region_table)
         basic_layout.addWidget(region_group)
         
@@ -163,7 +368,11 @@ class StatsTab(QWidget):
         # STATS Detailed section
         detailed_group = QGroupBox("STATS Detailed (Type + Region)")
         detailed_layout = QVBoxLayout(detailed_group)
-        self.detailed_table = self.create_detailed_table()
+        self.detailed_model = StatsTableModel(
+            self.DETAILED_COLUMNS, self.DETAILED_TOOLTIPS,
+            [attrgetter('asset_type'), attrgetter('region')], self
+        )
+        self.detailed_table = self.create_detailed_table(self.detailed_model)
         detailed_layout.addWidget(self.detailed_table)
         
         splitter.addWidget(detailed_group)
@@ -173,27 +382,15 @@ class StatsTab(QWidget):
         
         layout.addWidget(splitter)
     
-    def create_stats_table(self, table_name: str) -> QTableWidget:
+    def create_stats_table(self, table_name: str, model: StatsTableModel) -> QTableView:
         """Create a basic stats table."""
-        table = QTableWidget()
+        table = QTableView()
         table.setAlternatingRowColors(True)
-        columns = ["Category", "Current %", "Current All %", "Target %"]
-        table.setColumnCount(len(columns))
-        table.setHorizontalHeaderLabels(columns)
-        
-        # Set header tooltips
-        tooltips = [
-            "Asset type or region category",
-            "Allocation % of invested capital (excludes free cash)",
-            "Allocation % of total portfolio (includes free cash)",
-            "Sum of target allocations for this category"
-        ]
-        for i, tooltip in enumerate(tooltips):
-            table.horizontalHeaderItem(i).setToolTip(tooltip)
+        table.setModel(model)
         
         header = table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        for i in range(1, len(columns)):
+        for i in range(1, len(self.STATS_COLUMNS)):
             header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
         
         # Enable column reordering with persistence
@@ -201,226 +398,91 @@ class StatsTab(QWidget):
         
         return table
     
-    def create_detailed_table(self) -> QTableWidget:
-        """Create the detailed stats table."""
-        table = QTableWidget()
+    def create_detailed_table(self, model: StatsTableModel) -> QTableView:
+        """Create the detailed stats table (sortable through a proxy model)."""
+        table = QTableView()
         table.setAlternatingRowColors(True)
-        columns = ["Type", "Region", "Current %", "Current All %", "Target %"]
-        table.setColumnCount(len(columns))
-        table.setHorizontalHeaderLabels(columns)
-        
-        # Set header tooltips
-        tooltips = [
-            "Asset type (Equity, Bonds, etc.)",
-            "Geographic region (US, EU, EM, Global)",
-            "Allocation % of invested capital (excludes free cash)",
-            "Allocation % of total portfolio (includes free cash)",
-            "Sum of target allocations for this combination"
-        ]
-        for i, tooltip in enumerate(tooltips):
-            table.horizontalHeaderItem(i).setToolTip(tooltip)
+        
+        proxy = QSortFilterProxyModel(table)
+        proxy.setSourceModel(model)
+        proxy.setSortRole(StatsTableModel.SORT_ROLE)
+        table.setModel(proxy)
         
         header = table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        for i in range(2, len(columns)):
+        for i in range(2, len(self.DETAILED_COLUMNS)):
             header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
         
         # Enable column reordering with persistence
         setup_movable_columns(table, 'stats_detailed', self.settings_store)
         
+        # Start unsorted (calculator order, TOTAL last): enabling sorting
+        # would otherwise sort right away by the header's default indicator
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         table.setSortingEnabled(True)
         
         return table
     
     def refresh(self):
-        """Refresh all stats tables."""
-        self.refresh_type_table()
-        self.refresh_region_table()
-        self.refresh_detailed_table()
-    
-    def refresh_type_table(self):
-        """Refresh the type stats table and chart."""
-        stats = self.calculator.get_stats_by_type()
-        
-        # Filter out categories with no allocation
-        stats = [s for s in stats if s.current > 0 or s.target > 0]
+        """Schedule a refresh of all stats tables on the next event-loop turn.
         
-        # Update pie chart
-        chart_data = [(s.category, s.current) for s in stats if s.current > 0]
-        self.type_chart.update_chart(chart_data)
-        
-        self.type_table.setRowCount(len(stats) + 1)  # +1 for total row
-        
-        total_current = 0
-        total_current_all = 0
-        total_target = 0
-        
-        for row, stat in enumerate(stats):
-            # Category
-            item = QTableWidgetItem(stat.category)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.type_table.setItem(row, 0, item)
-            
-            # Current % - numeric sorting
-            item = NumericTableItem(f"{stat.current * 100:.2f}%", stat.current)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            self.type_table.setItem(row, 1, item)
-            total_current += stat.current
-            
-            # Current All % - numeric sorting
-            item = NumericTableItem(f"{stat.current_all * 100:.2f}%", stat.current_all)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            self.type_table.setItem(row, 2, item)
-            total_current_all += stat.current_all
-            
-            # Target % - numeric sorting
-            item = NumericTableItem(f"{stat.target * 100:.2f}%", stat.target)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            self.type_table.setItem(row, 3, item)
-            total_target += stat.target
-        
-        # Total row
-        total_row = len(stats)
-        
-        item = QTableWidgetItem("TOTAL")
-        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        font = item.font()
-        font.setBold(True)
-        item.setFont(font)
-        self.type_table.setItem(total_row, 0, item)
-        
-        for col, value in enumerate([total_current, total_current_all, total_target], 1):
-            item = NumericTableItem(f"{value * 100:.2f}%", value)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setFont(font)
-            self.type_table.setItem(total_row, col, item)
+        While the tab is hidden nothing is scheduled; showEvent catches up.
+        """
+        if self.isVisible():
+            self._refresh_timer.start()
+    
+    def showEvent(self, event):
+        """Bring the tables up to date when the tab becomes visible."""
+        super().showEvent(event)
+        self._do_refresh()
     
-    def refresh_region_table(self):
-        """Refresh the region stats table and chart."""
-        stats = self.calculator.get_stats_by_region()
+    def _do_refresh(self):
+        """Start computing the stats in the background (no-op if the calculator is unchanged)."""
+        if self._shutting_down or self.calculator.revision == self._last_revision:
+            return
+        if self._compute_thread is not None:
+            return  # _on_compute_thread_finished catches up
+        self._compute_thread = StatsComputeThread(self.calculator, self)
+        self._compute_thread.stats_ready.connect(self._on_stats_ready)
+        self._compute_thread.finished.connect(self._on_compute_thread_finished)
+        self._compute_thread.finished.connect(self._compute_thread.deleteLater)
+        self._compute_thread.start()
+    
+    def _on_compute_thread_finished(self):
+        """Start another computation if the calculator changed meanwhile."""
+        self._compute_thread = None  # Deleted via deleteLater
+        if self.isVisible():
+            self._do_refresh()
+    
+    def shutdown(self):
+        """Stop scheduling refreshes and wait for a running computation to end.
         
+        Call before the window closes, so the thread is never destroyed
+        while still running.
+        """
+        self._shutting_down = True
+        self._refresh_timer.stop()
+        if self._compute_thread is not None:
+            self._compute_thread.wait()
+    
+    def _on_stats_ready(self, revision: int, type_stats: list, region_stats: list,
+                        detailed_stats: list):
+        """Fill the tables and charts with freshly computed stats."""
+        if revision != self.calculator.revision:
+            return  # Stale: the calculator changed while computing
+        self._last_revision = revision
+        self._refresh_category_table(self.type_model, self.type_chart, type_stats)
+        self._refresh_category_table(self.region_model, self.region_chart, region_stats)
+        self.detailed_model.set_stats(detailed_stats)
+    
+    def _refresh_category_table(self, model: StatsTableModel, chart: PieChartWidget, stats: list):
+        """Fill a category stats table and its pie chart from the given stats."""
         # Filter out categories with no allocation
         stats = [s for s in stats if s.current > 0 or s.target > 0]
         
         # Update pie chart
         chart_data = [(s.category, s.current) for s in stats if s.current > 0]
-        self.region_chart.update_chart(chart_data)
-        
-        self.region_table.setRowCount(len(stats) + 1)  # +1 for total row
-        
-        total_current = 0
-        total_current_all = 0
-        total_target = 0
-        
-        for row, stat in enumerate(stats):
-            # Category
-            item = QTableWidgetItem(stat.category)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.region_table.setItem(row, 0, item)
-            
-            # Current % - numeric sorting
-            item = NumericTableItem(f"{stat.current * 100:.2f}%", stat.current)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            self.region_table.setItem(row, 1, item)
-            total_current += stat.current
-            
-            # Current All % - numeric sorting
-            item = NumericTableItem(f"{stat.current_all * 100:.2f}%", stat.current_all)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            self.region_table.setItem(row, 2, item)
-            total_current_all += stat.current_all
-            
-            # Target % - numeric sorting
-            item = NumericTableItem(f"{stat.target * 100:.2f}%", stat.target)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            self.region_table.setItem(row, 3, item)
-            total_target += stat.target
-        
-        # Total row
-        total_row = len(stats)
-        
-        item = QTableWidgetItem("TOTAL")
-        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        font = item.font()
-        font.setBold(True)
-        item.setFont(font)
-        self.region_table.setItem(total_row, 0, item)
-        
-        for col, value in enumerate([total_current, total_current_all, total_target], 1):
-            item = NumericTableItem(f"{value * 100:.2f}%", value)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setFont(font)
-            self.region_table.setItem(total_row, col, item)
-    
-    def refresh_detailed_table(self):
-        """Refresh the detailed stats table."""
-        stats = self.calculator.get_stats_detailed()
-        
-        self.detailed_table.setRowCount(len(stats) + 1)  # +1 for total row
-        
-        total_current = 0
-        total_current_all = 0
-        total_target = 0
-        
-        for row, stat in enumerate(stats):
-            # Type
-            item = QTableWidgetItem(stat.asset_type)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.detailed_table.setItem(row, 0, item)
-            
-            # Region
-            item = QTableWidgetItem(stat.region)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.detailed_table.setItem(row, 1, item)
-            
-            # Current % - numeric sorting
-            item = NumericTableItem(f"{stat.current * 100:.2f}%", stat.current)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            self.detailed_table.setItem(row, 2, item)
-            total_current += stat.current
-            
-            # Current All % - numeric sorting
-            item = NumericTableItem(f"{stat.current_all * 100:.2f}%", stat.current_all)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            self.detailed_table.setItem(row, 3, item)
-            total_current_all += stat.current_all
-            
-            # Target % - numeric sorting
-            item = NumericTableItem(f"{stat.target * 100:.2f}%", stat.target)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            self.detailed_table.setItem(row, 4, item)
-            total_target += stat.target
-        
-        # Total row
-        total_row = len(stats)
-        
-        item = QTableWidgetItem("TOTAL")
-        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        font = item.font()
-        font.setBold(True)
-        item.setFont(font)
-        self.detailed_table.setItem(total_row, 0, item)
-        
-        # Empty region cell for total row
-        item = QTableWidgetItem("")
-        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.detailed_table.setItem(total_row, 1, item)
-        
-        for col, value in enumerate([total_current, total_current_all, total_target], 2):
-            item = NumericTableItem(f"{value * 100:.2f}%", value)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(ALIGN_RIGHT_CENTER)
-            item.setFont(font)
-            self.detailed_table.setItem(total_row, col, item)
+        chart.update_chart(chart_data)
+        
+        model.set_stats(stats)
@@ -1,7 +1,8 @@
 """Shared UI utilities for Portfolio Tracker."""
 import re
-from PyQt6.QtWidgets import QTableWidgetItem, QTableWidget, QApplication
-from PyQt6.QtCore import Qt
+from functools import lru_cache, partial
+from PyQt6.QtWidgets import QTableWidgetItem, QTableView, QApplication
+from PyQt6.QtCore import Qt, QTimer, QByteArray
 from PyQt6.QtGui import QColor, QPalette
 
 
@@ -9,38 +10,71 @@ from PyQt6.QtGui import QColor, QPalette
 # Theme Detection
 # =============================================================================
 
+_dark_mode_cache = None
+
+
+def invalidate_theme_cache() -> None:
+    """Forget the cached theme so it is re-detected on next use.
+    
+    Connected to the application's paletteChanged signal.
+    """
+    global _dark_mode_cache
+    _dark_mode_cache = None
+    _THEME_COLORS.clear()
+
+
 def is_dark_mode() -> bool:
     """Detect if the application is using dark mode.
     
+    The result is cached until the palette changes.
+    
     Returns:
         True if dark mode is active, False otherwise
     """
+    global _dark_mode_cache
+    if _dark_mode_cache is not None:
+        return _dark_mode_cache
+    
     app = QApplication.instance()
     if app is None:
         return False
     
-    palette = app.palette()
-    # Compare window background luminance
-    bg_color = palette.color(QPalette.ColorRole.Window)
-    # Calculate perceived luminance
-    luminance = (0.299 * bg_color.red() + 0.587 * bg_color.green() + 0.114 * bg_color.blue()) / 255
-    return luminance < 0.5
+    # Compare window background lightness (computed by Qt)
+    bg_color = app.palette().color(QPalette.ColorRole.Window)
+    _dark_mode_cache = bg_color.lightnessF() < 0.5
+    return _dark_mode_cache
 
 
 # =============================================================================
 # UI Color Functions (Theme-Aware)
 # =============================================================================
 
+# Color pairs per theme, built once per theme change: (dark, light) RGB values
+_THEME_COLOR_VALUES = {
+    'row': (((45, 45, 48), (37, 37, 40)), ((255, 255, 255), (245, 245, 250))),
+    'highlight': (((60, 55, 30), (50, 45, 25)), ((255, 248, 220), (250, 243, 210))),
+    'warning': (((80, 75, 30), (80, 40, 40)), ((255, 255, 200), (255, 200, 200))),
+}
+_THEME_COLORS = {}
+
+
+def _theme_colors(kind: str) -> tuple:
+    """Return the cached color pair of the given kind for the current theme."""
+    colors = _THEME_COLORS.get(kind)
+    if colors is None:
+        dark, light = _THEME_COLOR_VALUES[kind]
+        colors = tuple(QColor(*rgb) for rgb in (dark if is_dark_mode() else light))
+        _THEME_COLORS[kind] = colors
+    return colors
+
+
 def get_row_colors():
     """Get alternating row colors based on current theme.
     
     Returns:
         Tuple of (even_color, odd_color)
     """
-    if is_dark_mode():
-        return (QColor(45, 45, 48), QColor(37, 37, 40))
-    else:
-        return (QColor(255, 255, 255), QColor(245, 245, 250))
+    return _theme_colors('row')
 
 
 def get_highlight_colors():
@@ -49,10 +83,7 @@ def get_highlight_colors():
     Returns:
         Tuple of (even_highlight, odd_highlight)
     """
-    if is_dark_mode():
-        return (QColor(60, 55, 30), QColor(50, 45, 25))
-    else:
-        return (QColor(255, 248, 220), QColor(250, 243, 210))
+    return _theme_colors('highlight')
 
 
 def get_warning_colors():
@@ -61,10 +92,7 @@ def get_warning_colors():
     Returns:
         Tuple of (yellow_warning, red_warning)
     """
-    if is_dark_mode():
-        return (QColor(80, 75, 30), QColor(80, 40, 40))
-    else:
-        return (QColor(255, 255, 200), QColor(255, 200, 200))
+    return _theme_colors('warning')
 
 
 # Legacy color constants (for backwards compatibility - prefer functions above)
@@ -77,8 +105,11 @@ HIGHLIGHT_COLOR_ODD = QColor(250, 243, 210)   # Slightly darker yellow for odd r
 WARNING_COLOR_YELLOW = QColor(255, 255, 200)  # Light yellow
 WARNING_COLOR_RED = QColor(255, 200, 200)     # Light red
 
-# Common text alignment
-ALIGN_RIGHT_CENTER = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+# Common text alignment, as a plain int so Qt calls skip enum conversion
+ALIGN_RIGHT_CENTER = (Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter).value
+
+# Item flags for read-only table cells (selectable, but not editable)
+NON_EDITABLE_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
 
 
 # =============================================================================
@@ -96,6 +127,7 @@ CURRENCY_SYMBOLS = {
 }
 
 
+@lru_cache(maxsize=64)
 def get_currency_symbol(currency: str) -> str:
     """Get the display symbol for a currency code.
     
@@ -112,10 +144,36 @@ def get_currency_symbol(currency: str) -> str:
 # Numeric Parsing Utilities
 # =============================================================================
 
+# Everything except digits, decimal point, and minus sign
+_NON_NUMERIC_RE = re.compile(r'[^\d.\-]')
+
+# str.translate table deleting the same characters for ASCII text and the
+# known currency symbols; anything else left over goes through the regex
+_NUMERIC_KEEP = set('0123456789.-')
+_NUMERIC_STRIP_TABLE = {cp: None for cp in range(0x80) if chr(cp) not in _NUMERIC_KEEP}
+_NUMERIC_STRIP_TABLE.update(
+    (ord(ch), None) for symbol in CURRENCY_SYMBOLS.values() for ch in symbol
+    if ch not in _NUMERIC_KEEP
+)
+
+# Single-character currency symbols handled by the parse fast path
+_CURRENCY_SYMBOL_CHARS = frozenset(
+    symbol for symbol in CURRENCY_SYMBOLS.values() if len(symbol) == 1
+)
+
+
+def _is_plain_number(text: str) -> bool:
+    """Check if text is an optional minus sign, ASCII digits and at most one decimal point."""
+    digits = text.removeprefix('-').replace('.', '', 1)
+    return digits.isascii() and digits.isdigit()
+
+
+@lru_cache(maxsize=4096)
 def parse_numeric_text(text: str) -> float:
     """Parse a numeric value from formatted text.
     
     Strips currency symbols, commas, and other non-numeric characters.
+    Results are cached, since table cells repeat the same strings often.
     
     Args:
         text: Text that may contain a number with formatting
@@ -126,8 +184,18 @@ def parse_numeric_text(text: str) -> float:
     if not text:
         return 0.0
     
+    # Fast paths: a plain number, or one with a single leading currency symbol
+    if _is_plain_number(text):
+        return float(text)
+    if text[0] in _CURRENCY_SYMBOL_CHARS:
+        rest = text[1:].replace(',', '')
+        if _is_plain_number(rest):
+            return float(rest)
+    
     # Remove everything except digits, decimal point, and minus sign
-    numeric_text = re.sub(r'[^\d.\-]', '', text.strip())
+    numeric_text = text.translate(_NUMERIC_STRIP_TABLE)
+    if not numeric_text.isascii():
+        numeric_text = _NON_NUMERIC_RE.sub('', numeric_text)
     
     try:
         return float(numeric_text) if numeric_text else 0.0
@@ -146,6 +214,8 @@ class NumericTableItem(QTableWidgetItem):
     percentages, etc.) to ensure proper numeric sorting.
     """
     
+    __slots__ = ('_sort_value',)
+    
     def __init__(self, display_text: str, sort_value: float):
         """Initialize with display text and sort value.
         
@@ -156,90 +226,121 @@ class NumericTableItem(QTableWidgetItem):
         super().__init__(display_text)
         self._sort_value = sort_value
     
+    def set_value(self, display_text: str, sort_value: float) -> None:
+        """Update display text and sort value in place (for reusing items).
+        
+        Args:
+            display_text: Text to display in the cell
+            sort_value: Numeric value used for sorting
+        """
+        self.setText(display_text)
+        self._sort_value = sort_value
+    
     def __lt__(self, other):
-        if isinstance(other, NumericTableItem):
+        # EAFP: no type check per comparison while sorting; only mixed
+        # columns pay for the exception
+        try:
             return self._sort_value < other._sort_value
-        return super().__lt__(other)
+        except AttributeError:
+            return super().__lt__(other)
 
 
 # =============================================================================
 # Column Order Management
 # =============================================================================
 
-def save_column_order(table: QTableWidget, table_name: str, settings_store) -> None:
+def save_column_order(table: QTableView, table_name: str, settings_store) -> None:
     """Save the current column order for a table.
     
+    The header's own saveState() blob is stored, hex-encoded like the
+    window geometry.
+    
     Args:
-        table: The QTableWidget whose column order to save
+        table: The table view whose column order to save
         table_name: Unique identifier for the table in settings
         settings_store: SettingsStore instance for persistence
     """
-    header = table.horizontalHeader()
-    order = [header.logicalIndex(i) for i in range(header.count())]
-    settings_store.set_column_order(table_name, order)
+    state = table.horizontalHeader().saveState()
+    settings_store.set_column_state(table_name, state.toHex().data().decode())
 
 
-def restore_column_order(table: QTableWidget, table_name: str, settings_store) -> None:
+def restore_column_order(table: QTableView, table_name: str, settings_store) -> None:
     """Restore saved column order for a table.
     
+    Uses the saved header state if there is one and it matches the table's
+    column count, otherwise falls back to a column order list saved by
+    earlier versions.
+    
     Args:
-        table: The QTableWidget whose column order to restore
+        table: The table view whose column order to restore
         table_name: Unique identifier for the table in settings
         settings_store: SettingsStore instance for persistence
     """
+    header = table.horizontalHeader()
+    state = settings_store.get_column_state(table_name)
+    if state:
+        model = table.model()
+        column_count = model.columnCount() if model is not None else header.count()
+        default_state = header.saveState()
+        try:
+            if header.restoreState(QByteArray.fromHex(state.encode())):
+                # Qt accepts states saved with a different column count
+                if header.count() == column_count:
+                    # The state also carries the sort indicator; sorting is
+                    # not meant to persist, so start unsorted
+                    header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+                    return
+                header.restoreState(default_state)
+                print(f"Warning: Saved column layout for '{table_name}' does not match the table, ignoring it")
+            else:
+                print(f"Warning: Could not restore column layout for '{table_name}'")
+        except Exception as e:
+            print(f"Warning: Could not restore column layout for '{table_name}': {e}")
+    
     order = settings_store.get_column_order(table_name)
     if order:
-        header = table.horizontalHeader()
-        for visual_index, logical_index in enumerate(order):
-            if logical_index < header.count():
-                current_visual = header.visualIndex(logical_index)
-                if current_visual != visual_index:
-                    header.moveSection(current_visual, visual_index)
-
-
-def setup_movable_columns(table: QTableWidget, table_name: str, settings_store) -> None:
+        count = header.count()
+        # Current logical index at each visual position, tracked in Python
+        # so the loop doesn't query the header after every move
+        visual_order = list(map(header.logicalIndex, range(count)))
+        
+        # Don't emit sectionMoved (and trigger a save) or repaint for every
+        # intermediate move
+        table.setUpdatesEnabled(False)
+        header.blockSignals(True)
+        try:
+            for visual_index, logical_index in enumerate(order):
+                if logical_index < count and visual_index < count:
+                    current_visual = visual_order.index(logical_index)
+                    if current_visual != visual_index:
+                        header.moveSection(current_visual, visual_index)
+                        visual_order.insert(visual_index, visual_order.pop(current_visual))
+        finally:
+            header.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+
+def setup_movable_columns(table: QTableView, table_name: str, settings_store) -> None:
     """Enable movable columns with automatic save/restore.
     
     Args:
-        table: The QTableWidget to configure
+        table: The table view to configure
         table_name: Unique identifier for the table in settings
         settings_store: SettingsStore instance for persistence
     """
     header = table.horizontalHeader()
     header.setSectionsMovable(True)
-    header.sectionMoved.connect(
-        lambda l, o, n: save_column_order(table, table_name, settings_store)
-    )
     restore_column_order(table, table_name, settings_store)
-
-
-# =============================================================================
-# Row Styling Utilities
-# =============================================================================
-
-def get_alternating_row_color(row: int) -> QColor:
-    """Get the background color for alternating rows (theme-aware).
     
-    Args:
-        row: Row index (0-based)
-        
-    Returns:
-        QColor for the row background
-    """
-    even_color, odd_color = get_row_colors()
-    return even_color if row % 2 == 0 else odd_color
-
-
-def get_highlight_row_color(row: int) -> QColor:
-    """Get the highlighted background color for alternating rows (theme-aware).
+    # Connect only once per table, so repeated setup doesn't stack up saves
+    if getattr(table, '_column_order_save_timer', None) is not None:
+        return
     
-    Use for columns that need visual emphasis (e.g., target-related columns).
-    
-    Args:
-        row: Row index (0-based)
-        
-    Returns:
-        QColor for the highlighted row background
-    """
-    even_highlight, odd_highlight = get_highlight_colors()
-    return even_highlight if row % 2 == 0 else odd_highlight
+    # Debounce saves so dragging a column across several positions persists once
+    save_timer = QTimer(table)
+    save_timer.setSingleShot(True)
+    save_timer.setInterval(250)
+    save_timer.timeout.connect(partial(save_column_order, table, table_name, settings_store))
+    header.sectionMoved.connect(lambda l, o, n: save_timer.start())
+    table._column_order_save_timer = save_timer
+